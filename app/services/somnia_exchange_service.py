@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from web3 import Web3, AsyncWeb3
@@ -171,6 +171,19 @@ class SomniaExchangeService:
             logger.error(f"Error getting quote: {e}")
             raise
 
+    async def quote_batch(self, quotes: Sequence[Tuple[int, int, int]]) -> List[int]:
+        """Get quotes for several (amount_a, reserve_a, reserve_b) triples in one JSON-RPC batch."""
+        try:
+            async with self.w3.batch_requests() as batch:
+                for amount_a, reserve_a, reserve_b in quotes:
+                    batch.add(self.contract.functions.quote(amount_a, reserve_a, reserve_b))
+                results = await batch.async_execute()
+            logger.info(f"Batch quotes: {results}")
+            return list(results)
+        except Exception as e:
+            logger.error(f"Error getting batch quotes: {e}")
+            raise
+
     # ==================== Token Approval Functions ====================
 
     async def approve_token(
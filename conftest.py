@@ -5,21 +5,9 @@ This file contains global pytest configuration and plugins
 that apply to the entire test suite.
 """
 
-import pytest
-import asyncio
-
 # Global pytest plugins
 pytest_plugins = []
 
-# Global fixtures
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
-
 # Global pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -43,4 +31,7 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "config: marks tests for configuration validation"
-    )
\ No newline at end of file
+    )
+    config.addinivalue_line(
+        "markers", "serial: marks per-check tests that only run with --serial"
+    )
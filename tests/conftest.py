@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the test suite.
+
+Makes the project root importable once per session so individual
+test modules don't need to patch ``sys.path`` themselves.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
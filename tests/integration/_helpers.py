@@ -0,0 +1,16 @@
+"""
+Plain helpers shared by the integration test modules.
+
+Kept out of conftest.py so importing them does not execute the conftest a
+second time under another module name.
+"""
+
+import re
+
+
+def is_hex(value, nbytes: int) -> bool:
+    """Return True if value is exactly 0x followed by 2 * nbytes hex digits.
+
+    Shared by the integration modules that check addresses (20 bytes) and keys (32 bytes).
+    """
+    return isinstance(value, str) and re.fullmatch(r'0x[0-9a-fA-F]{%d}' % (2 * nbytes), value) is not None
@@ -0,0 +1,166 @@
+"""
+Shared fixtures for the integration test suite.
+
+Fixtures defined here are built once per session and reused by every
+integration module that requests them.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.core.backend_config import settings
+
+# Rebind the console streams to UTF-8 on Windows so emoji log output does not
+# raise UnicodeEncodeError; PYTHONIOENCODING is read too late to help here.
+if sys.platform.startswith('win'):
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
+# Keep INFO chatter from the integration modules unformatted by default; their own
+# basicConfig calls are no-ops once this runs, so LOG_LEVEL is honoured here
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+
+
+def pytest_runtest_setup(item):
+    """Write one banner per test when output is not captured (-s), so tests need not print their own."""
+    config = item.config
+    if config.getoption("capture") != "no":
+        return
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_sep("=", f"▶ {item.nodeid}")
+
+
+def pytest_addoption(parser):
+    """Register --serial here so it exists when pytest is rooted at this directory."""
+    parser.addoption(
+        "--serial", action="store_true", default=False,
+        help="run per-check serial tests instead of their parallel drivers"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run either the serial per-check tests or their parallel drivers, not both."""
+    serial = config.getoption("--serial")
+    skip_serial = pytest.mark.skip(reason="serial check; covered by parallel driver (use --serial)")
+    skip_parallel = pytest.mark.skip(reason="parallel driver; --serial runs the individual checks")
+    for item in items:
+        if "serial" in item.keywords and not serial:
+            item.add_marker(skip_serial)
+        elif item.name.endswith("_parallel") and serial:
+            item.add_marker(skip_parallel)
+
+
+@pytest.fixture(scope="session")
+def test_app():
+    """Create FastAPI test application."""
+    # Imported here so modules that never request the app skip FastAPI at collection
+    from fastapi import FastAPI
+    from app.api.routes.exchange import router
+    
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_client(test_app):
+    """Session-wide HTTP client bound to the FastAPI test application."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=test_app), base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def w3():
+    """Session-wide AsyncWeb3 instance so every test reuses one RPC connection pool."""
+    import aiohttp
+    from web3 import AsyncWeb3, WebSocketProvider
+    from web3.providers.rpc.utils import ExceptionRetryConfiguration
+    
+    session = None
+    
+    async def close():
+        if session is not None:
+            await session.close()
+        else:
+            await web3.provider.disconnect()
+    
+    if settings.RPC_URL.startswith("ws"):
+        # One persistent socket carries every JSON-RPC call of the session
+        try:
+            web3 = await AsyncWeb3(WebSocketProvider(settings.RPC_URL))
+        except Exception as e:
+            pytest.skip(f"❌ Blockchain connection error: {e}")
+    else:
+        # Transient RPC failures (dropped connections, 5xx, timeouts) are retried by the
+        # provider itself with exponential backoff instead of failing the test outright
+        provider = AsyncWeb3.AsyncHTTPProvider(
+            settings.RPC_URL,
+            request_kwargs={"timeout": 20},
+            exception_retry_configuration=ExceptionRetryConfiguration(
+                errors=(aiohttp.ClientError, asyncio.TimeoutError),
+                retries=3,
+                backoff_factor=0.5,
+            ),
+        )
+        
+        # Size the pool for concurrent RPC calls and keep connections/DNS warm
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=60,
+            ttl_dns_cache=300
+        ))
+        await provider.cache_async_session(session)
+        web3 = AsyncWeb3(provider)
+    
+    # Probe reachability once per session; every dependent test skips together
+    try:
+        is_connected = await web3.is_connected()
+    except Exception as e:
+        is_connected = False
+        reason = f"❌ Blockchain connection error: {e}"
+    else:
+        reason = "❌ Failed to connect to blockchain"
+    if not is_connected:
+        await close()
+        pytest.skip(reason)
+    
+    yield web3
+    await close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def latest_block(w3):
+    """Latest block, fetched once per session from the shared AsyncWeb3 instance."""
+    try:
+        return await w3.eth.get_block('latest')
+    except Exception as e:
+        pytest.skip(f"❌ Blockchain connection error: {e}")
+
+
+@pytest.fixture(scope="session")
+def exchange_service(w3):
+    """Exchange service bound to the shared AsyncWeb3 instance."""
+    from app.services.somnia_exchange_service import SomniaExchangeService
+    
+    return SomniaExchangeService(w3, settings.ROUTER_ADDRESS)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def exchange_addresses(exchange_service):
+    """WETH and factory addresses, read once per session since they never change on-chain."""
+    try:
+        weth, factory = await asyncio.gather(
+            exchange_service.get_weth_address(),
+            exchange_service.get_factory_address()
+        )
+    except Exception as e:
+        pytest.skip(f"❌ Exchange service error: {e}")
+    return {"weth": weth, "factory": factory}
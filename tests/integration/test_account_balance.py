@@ -8,64 +8,107 @@ This test demonstrates how to:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import functools
 import logging
-import sys
-from pathlib import Path
-from web3 import AsyncWeb3
+from typing import TYPE_CHECKING
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import aiohttp
 
 from app.core.backend_config import settings
-from app.services.account_service import AccountService, get_address_from_private_key
+
+# web3 (and the account service built on it) is imported lazily inside the
+# fixtures so that collecting this module stays cheap
+if TYPE_CHECKING:
+    from app.services.account_service import AccountService
+
+# Skip the whole module up front when blockchain configuration is missing
+if not (settings.PRIVATE_KEY and settings.RPC_URL and settings.CHAIN_ID):
+    pytest.skip("Blockchain configuration missing", allow_module_level=True)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Errors raised by the first real RPC call when the node is unreachable
+CONNECTION_ERRORS = (aiohttp.ClientConnectorError, asyncio.TimeoutError)
+
+# Settings attributes holding the token addresses checked by these tests
+TOKEN_ATTRS = ("WSTT", "SUSDT")
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_address(private_key: str) -> str:
+    """Derive the address for a private key once per process."""
+    from app.services.account_service import get_address_from_private_key
+    return get_address_from_private_key(private_key)
+
+
+async def get_token_balances(service: "AccountService", address: str) -> dict:
+    """Fetch balances of all configured tokens concurrently, skipping failures."""
+    tokens = [(attr, getattr(settings, attr)) for attr in TOKEN_ATTRS if getattr(settings, attr)]
+    results = await asyncio.gather(
+        *(service.get_token_balance(address, token_address) for _, token_address in tokens),
+        return_exceptions=True
+    )
+    
+    token_balances = {}
+    for (token_name, _), result in zip(tokens, results):
+        if isinstance(result, Exception):
+            logger.warning("⚠️ Failed to get %s balance: %s", token_name, result)
+            continue
+        
+        token_balances[token_name] = {
+            "address": result.token_address,
+            "symbol": result.token_symbol,
+            "name": result.token_name,
+            "balance": str(result.balance),
+            "decimals": result.decimals
+        }
+        logger.info("✅ %s Balance: %s %s", token_name, result.balance, result.token_symbol)
+    
+    return token_balances
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_settings():
     """Fixture to provide configuration settings."""
     return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def derived_address():
     """Fixture to provide derived address from private key."""
-    try:
-        if not settings.PRIVATE_KEY:
-            pytest.skip("Private key not found in environment configuration")
-        return get_address_from_private_key(settings.PRIVATE_KEY)
-    except Exception as e:
-        pytest.skip(f"Cannot derive address from private key: {e}")
+    return _cached_address(settings.PRIVATE_KEY)
 
 
-@pytest.fixture
-def account_service_factory(config_settings):
-    """Factory fixture to create AccountService instances."""
-    async def _create_service():
-        try:
-            # Create async Web3 instance
-            w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(config_settings.RPC_URL))
-            
-            # Test connection
-            is_connected = await w3.is_connected()
-            if not is_connected:
-                pytest.skip(f"Cannot connect to blockchain at {config_settings.RPC_URL}")
-            
-            logger.info(f"✅ Connected to blockchain at {config_settings.RPC_URL}")
-            
-            # Create account service
-            service = AccountService(w3, config_settings.CHAIN_ID)
-            return service
-            
-        except Exception as e:
-            pytest.skip(f"Failed to setup Web3 service: {e}")
+@pytest.fixture(scope="session")
+def account_service(w3, config_settings):
+    """Session-wide AccountService bound to the shared AsyncWeb3 instance."""
+    from app.services.account_service import AccountService
     
-    return _create_service
+    return AccountService(w3, config_settings.CHAIN_ID)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def balance_snapshot(account_service, derived_address):
+    """Fetch balance, nonce, contract flag and latest block once per session."""
+    try:
+        eth_balance, nonce, is_contract, latest_block = await asyncio.gather(
+            account_service.get_eth_balance(derived_address),
+            account_service.get_transaction_count(derived_address),
+            account_service.is_contract_address(derived_address),
+            account_service.w3.eth.get_block('latest'),
+        )
+    except CONNECTION_ERRORS as e:
+        pytest.skip(f"Cannot connect to blockchain at {settings.RPC_URL}: {e}")
+    return {
+        "eth_balance": eth_balance,
+        "nonce": nonce,
+        "is_contract": is_contract,
+        "latest_block": latest_block
+    }
 
 
 class TestAccountBalance:
@@ -73,165 +116,93 @@ class TestAccountBalance:
     
     def test_configuration_loaded(self, config_settings):
         """Test that configuration is properly loaded."""
-        print("\n🔧 Configuration Test")
-        print("=" * 50)
-        
         assert config_settings.PRIVATE_KEY is not None, "Private key not found"
         assert config_settings.RPC_URL is not None, "RPC URL not found"
         assert config_settings.CHAIN_ID is not None, "Chain ID not found"
         
-        logger.info(f"✅ Configuration loaded:")
-        logger.info(f"  RPC URL: {config_settings.RPC_URL}")
-        logger.info(f"  Chain ID: {config_settings.CHAIN_ID}")
-        logger.info(f"  Private key loaded: {'Yes' if config_settings.PRIVATE_KEY else 'No'}")
+        logger.info("✅ Configuration loaded:")
+        logger.info("  RPC URL: %s", config_settings.RPC_URL)
+        logger.info("  Chain ID: %s", config_settings.CHAIN_ID)
+        logger.info("  Private key loaded: %s", 'Yes' if config_settings.PRIVATE_KEY else 'No')
     
     def test_address_derivation(self, config_settings, derived_address):
         """Test address derivation from private key."""
-        print("\n📝 Address Derivation Test")
-        print("=" * 50)
-        
         assert derived_address is not None, "Failed to derive address"
         assert derived_address.startswith('0x'), "Address should start with 0x"
         assert len(derived_address) == 42, "Address should be 42 characters"
         
-        logger.info(f"✅ Address derived from private key: {derived_address}")
+        if config_settings.ADDRESS:
+            assert derived_address.lower() == config_settings.ADDRESS.lower(), \
+                "Derived address should match configured ADDRESS"
+        
+        logger.info("✅ Address derived from private key: %s", derived_address)
     
-    @pytest.mark.asyncio
-    async def test_blockchain_connection(self, account_service_factory):
+    async def test_blockchain_connection(self, account_service):
         """Test blockchain connection."""
-        print("\n🔗 Blockchain Connection Test")
-        print("=" * 50)
-        
-        # Create account service
-        account_service = await account_service_factory()
-        
         assert account_service is not None, "Account service should be initialized"
         
         # Test that we can make a basic call
-        latest_block = await account_service.w3.eth.get_block('latest')
+        try:
+            latest_block = await account_service.w3.eth.get_block('latest')
+        except CONNECTION_ERRORS as e:
+            pytest.skip(f"Cannot connect to blockchain at {settings.RPC_URL}: {e}")
         
         assert latest_block is not None, "Should be able to get latest block"
         assert latest_block['number'] > 0, "Block number should be positive"
         
-        logger.info(f"✅ Successfully connected to blockchain")
-        logger.info(f"✅ Latest block: {latest_block['number']}")
+        logger.info("✅ Successfully connected to blockchain")
+        logger.info("✅ Latest block: %s", latest_block['number'])
     
-    @pytest.mark.asyncio
-    async def test_account_balance_retrieval(self, account_service_factory, derived_address):
+    async def test_account_balance_retrieval(self, balance_snapshot, derived_address):
         """Test account balance retrieval."""
-        print("\n💰 Account Balance Test")
-        print("=" * 50)
-        
-        # Create account service
-        account_service = await account_service_factory()
-        
         # Get SOMI balance
-        eth_balance = await account_service.get_eth_balance(derived_address)
+        eth_balance = balance_snapshot["eth_balance"]
         
         assert eth_balance is not None, "Should be able to get balance"
         assert eth_balance >= 0, "Balance should be non-negative"
         
         # Get transaction count (nonce)
-        nonce = await account_service.get_transaction_count(derived_address)
+        nonce = balance_snapshot["nonce"]
         
         assert nonce is not None, "Should be able to get nonce"
         assert nonce >= 0, "Nonce should be non-negative"
         
         # Check if address is a contract
-        is_contract = await account_service.is_contract_address(derived_address)
+        is_contract = balance_snapshot["is_contract"]
         
         assert isinstance(is_contract, bool), "is_contract should be boolean"
         
-        logger.info(f"✅ Account balance retrieved successfully:")
-        logger.info(f"  Address: {derived_address}")
-        logger.info(f"  SOMI Balance: {eth_balance}")
-        logger.info(f"  Nonce: {nonce}")
-        logger.info(f"  Is Contract: {is_contract}")
+        logger.info("✅ Account balance retrieved successfully:")
+        logger.info("  Address: %s", derived_address)
+        logger.info("  SOMI Balance: %s", eth_balance)
+        logger.info("  Nonce: %s", nonce)
+        logger.info("  Is Contract: %s", is_contract)
     
-    @pytest.mark.asyncio
-    async def test_token_balances(self, account_service_factory, derived_address, config_settings):
+    async def test_token_balances(self, account_service, derived_address, config_settings):
         """Test token balance retrieval for configured tokens."""
-        print("\n🪙 Token Balance Test")
-        print("=" * 50)
-        
-        # Create account service
-        account_service = await account_service_factory()
-        
-        token_balances = {}
+        # Don't fail the test for token balance issues; failures are logged and skipped
+        token_balances = await get_token_balances(account_service, derived_address)
         
-        # Test WSTT token balance if configured
-        if config_settings.WSTT:
-            try:
-                wstt_balance = await account_service.get_token_balance(derived_address, config_settings.WSTT)
-                
-                assert wstt_balance is not None, "Should get WSTT balance object"
-                assert hasattr(wstt_balance, 'balance'), "Balance object should have balance attribute"
-                assert hasattr(wstt_balance, 'token_symbol'), "Balance object should have symbol"
-                
-                token_balances['WSTT'] = {
-                    "address": wstt_balance.token_address,
-                    "symbol": wstt_balance.token_symbol,
-                    "name": wstt_balance.token_name,
-                    "balance": str(wstt_balance.balance),
-                    "decimals": wstt_balance.decimals
-                }
-                
-                logger.info(f"✅ WSTT Balance: {wstt_balance.balance} {wstt_balance.token_symbol}")
-                
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to get WSTT balance: {e}")
-                # Don't fail the test for token balance issues
-        
-        # Test SUSDT token balance if configured
-        if config_settings.SUSDT:
-            try:
-                susdt_balance = await account_service.get_token_balance(derived_address, config_settings.SUSDT)
-                
-                assert susdt_balance is not None, "Should get SUSDT balance object"
-                
-                token_balances['SUSDT'] = {
-                    "address": susdt_balance.token_address,
-                    "symbol": susdt_balance.token_symbol,
-                    "name": susdt_balance.token_name,
-                    "balance": str(susdt_balance.balance),
-                    "decimals": susdt_balance.decimals
-                }
-                
-                logger.info(f"✅ SUSDT Balance: {susdt_balance.balance} {susdt_balance.token_symbol}")
-                
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to get SUSDT balance: {e}")
-                # Don't fail the test for token balance issues
+        for token_name, token_info in token_balances.items():
+            assert token_info["balance"] is not None, f"Should get {token_name} balance"
+            assert token_info["symbol"] is not None, f"{token_name} balance should have symbol"
         
         # At least verify we attempted to get token balances
-        if config_settings.WSTT or config_settings.SUSDT:
-            logger.info(f"✅ Token balance test completed, found {len(token_balances)} tokens")
+        if any(getattr(config_settings, attr) for attr in TOKEN_ATTRS):
+            logger.info("✅ Token balance test completed, found %s tokens", len(token_balances))
         else:
             logger.info("ℹ️ No token addresses configured for testing")
     
-    @pytest.mark.asyncio
-    async def test_portfolio_summary(self, account_service_factory, derived_address, config_settings):
+    async def test_portfolio_summary(self, balance_snapshot, derived_address, config_settings):
         """Test complete portfolio summary generation."""
-        print("\n📊 Portfolio Summary Test")
-        print("=" * 50)
-        
-        # Create account service
-        account_service = await account_service_factory()
-        
-        # Get account balance
-        eth_balance = await account_service.get_eth_balance(derived_address)
-        nonce = await account_service.get_transaction_count(derived_address)
-        is_contract = await account_service.is_contract_address(derived_address)
-        latest_block = await account_service.w3.eth.get_block('latest')
-        
         # Create portfolio summary
         portfolio_summary = {
             "account_info": {
                 "address": derived_address,
-                "eth_balance": str(eth_balance),
-                "nonce": nonce,
-                "is_contract": is_contract,
-                "latest_block": latest_block['number'],
+                "eth_balance": str(balance_snapshot["eth_balance"]),
+                "nonce": balance_snapshot["nonce"],
+                "is_contract": balance_snapshot["is_contract"],
+                "latest_block": balance_snapshot["latest_block"]['number'],
                 "chain_id": config_settings.CHAIN_ID
             },
             "configuration": {
@@ -249,16 +220,12 @@ class TestAccountBalance:
         assert portfolio_summary["account_info"]["address"] == derived_address, "Address should match"
         
         logger.info("✅ Portfolio Summary:")
-        logger.info(f"  SOMI Balance: {portfolio_summary['account_info']['eth_balance']}")
-        logger.info(f"  Chain ID: {portfolio_summary['account_info']['chain_id']}")
-        logger.info(f"  Latest Block: {portfolio_summary['account_info']['latest_block']}")
+        logger.info("  SOMI Balance: %s", portfolio_summary['account_info']['eth_balance'])
+        logger.info("  Chain ID: %s", portfolio_summary['account_info']['chain_id'])
+        logger.info("  Latest Block: %s", portfolio_summary['account_info']['latest_block'])
     
-    @pytest.mark.asyncio
-    async def test_complete_integration_workflow(self, config_settings, derived_address, account_service_factory):
+    async def test_complete_integration_workflow(self, config_settings, derived_address, account_service, balance_snapshot):
         """Test the complete integration workflow."""
-        print("\n🚀 Complete Integration Workflow Test")
-        print("=" * 60)
-        
         try:
             # Step 1: Verify configuration
             assert config_settings.PRIVATE_KEY is not None
@@ -269,38 +236,24 @@ class TestAccountBalance:
             # Step 2: Verify address derivation
             assert derived_address is not None
             assert derived_address.startswith('0x')
-            logger.info(f"✅ Step 2: Address derived: {derived_address}")
+            logger.info("✅ Step 2: Address derived: %s", derived_address)
             
-            # Step 3: Create account service and verify blockchain connection
-            account_service = await account_service_factory()
-            latest_block = await account_service.w3.eth.get_block('latest')
+            # Step 3: Verify blockchain connection
+            latest_block = balance_snapshot["latest_block"]
             assert latest_block['number'] > 0
-            logger.info(f"✅ Step 3: Blockchain connected, block: {latest_block['number']}")
+            logger.info("✅ Step 3: Blockchain connected, block: %s", latest_block['number'])
             
             # Step 4: Verify account balance retrieval
-            eth_balance = await account_service.get_eth_balance(derived_address)
-            nonce = await account_service.get_transaction_count(derived_address)
+            eth_balance = balance_snapshot["eth_balance"]
+            nonce = balance_snapshot["nonce"]
             assert eth_balance >= 0
             assert nonce >= 0
-            logger.info(f"✅ Step 4: Balance retrieved: {eth_balance} SOMI, nonce: {nonce}")
+            logger.info("✅ Step 4: Balance retrieved: %s SOMI, nonce: %s", eth_balance, nonce)
             
             # Step 5: Verify token balance attempts (don't fail if tokens don't exist)
-            token_count = 0
-            if config_settings.WSTT:
-                try:
-                    await account_service.get_token_balance(derived_address, config_settings.WSTT)
-                    token_count += 1
-                except Exception:
-                    pass  # Token might not exist or have balance
-            
-            if config_settings.SUSDT:
-                try:
-                    await account_service.get_token_balance(derived_address, config_settings.SUSDT)
-                    token_count += 1
-                except Exception:
-                    pass  # Token might not exist or have balance
+            token_count = len(await get_token_balances(account_service, derived_address))
             
-            logger.info(f"✅ Step 5: Token balance checks completed for {token_count} tokens")
+            logger.info("✅ Step 5: Token balance checks completed for %s tokens", token_count)
             
             logger.info("🎉 Complete integration workflow test passed!")
             
@@ -317,30 +270,29 @@ class AccountBalanceTest:
         self.rpc_url = settings.RPC_URL
         self.chain_id = settings.CHAIN_ID
         
-        logger.info(f"Initialized test with:")
-        logger.info(f"  RPC URL: {self.rpc_url}")
-        logger.info(f"  Chain ID: {self.chain_id}")
-        logger.info(f"  Private key loaded: {'Yes' if self.private_key else 'No'}")
+        logger.info("Initialized test with:")
+        logger.info("  RPC URL: %s", self.rpc_url)
+        logger.info("  Chain ID: %s", self.chain_id)
+        logger.info("  Private key loaded: %s", 'Yes' if self.private_key else 'No')
     
-    async def setup_web3_service(self) -> AccountService:
+    async def setup_web3_service(self) -> "AccountService":
         """Setup Web3 connection and AccountService."""
+        from web3 import AsyncWeb3, WebSocketProvider
+        from app.services.account_service import AccountService
+        
         try:
-            # Create async Web3 instance
-            w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
-            
-            # Test connection
-            is_connected = await w3.is_connected()
-            if not is_connected:
-                raise ConnectionError(f"Failed to connect to {self.rpc_url}")
-            
-            logger.info("✅ Successfully connected to blockchain")
+            # Create async Web3 instance; connectivity surfaces on the first real call
+            if self.rpc_url.startswith("ws"):
+                w3 = await AsyncWeb3(WebSocketProvider(self.rpc_url))
+            else:
+                w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
             
             # Create account service
             service = AccountService(w3, self.chain_id)
             return service
             
         except Exception as e:
-            logger.error(f"❌ Failed to setup Web3 service: {e}")
+            logger.error("❌ Failed to setup Web3 service: %s", e)
             raise
     
     def get_address_from_private_key_test(self) -> str:
@@ -349,17 +301,17 @@ class AccountBalanceTest:
             if not self.private_key:
                 raise ValueError("Private key not found in environment configuration")
             
-            # Use the utility function from account_service
-            address = get_address_from_private_key(self.private_key)
+            # Use the cached utility function from account_service
+            address = _cached_address(self.private_key)
             
-            logger.info(f"✅ Address derived from private key: {address}")
+            logger.info("✅ Address derived from private key: %s", address)
             return address
             
         except Exception as e:
-            logger.error(f"❌ Failed to derive address from private key: {e}")
+            logger.error("❌ Failed to derive address from private key: %s", e)
             raise
     
-    async def get_account_balance_test(self, service: AccountService, address: str) -> dict:
+    async def get_account_balance_test(self, service: "AccountService", address: str) -> dict:
         """Test getting account balance."""
         try:
             # Get SOMI balance
@@ -383,58 +335,26 @@ class AccountBalanceTest:
                 "chain_id": self.chain_id
             }
             
-            logger.info(f"✅ Account balance retrieved successfully:")
-            logger.info(f"  Address: {address}")
-            logger.info(f"  SOMI Balance: {eth_balance}")
-            logger.info(f"  Nonce: {nonce}")
-            logger.info(f"  Is Contract: {is_contract}")
-            logger.info(f"  Latest Block: {latest_block['number']}")
+            logger.info("✅ Account balance retrieved successfully:")
+            logger.info("  Address: %s", address)
+            logger.info("  SOMI Balance: %s", eth_balance)
+            logger.info("  Nonce: %s", nonce)
+            logger.info("  Is Contract: %s", is_contract)
+            logger.info("  Latest Block: %s", latest_block['number'])
             
             return result
             
         except Exception as e:
-            logger.error(f"❌ Failed to get account balance: {e}")
+            logger.error("❌ Failed to get account balance: %s", e)
             raise
     
-    async def test_token_balance(self, service: AccountService, address: str) -> dict:
+    async def test_token_balance(self, service: "AccountService", address: str) -> dict:
         """Test getting token balances for configured tokens."""
         try:
-            token_balances = {}
-            
-            # Test WSTT token balance
-            if settings.WSTT:
-                try:
-                    wstt_balance = await service.get_token_balance(address, settings.WSTT)
-                    token_balances['WSTT'] = {
-                        "address": wstt_balance.token_address,
-                        "symbol": wstt_balance.token_symbol,
-                        "name": wstt_balance.token_name,
-                        "balance": str(wstt_balance.balance),
-                        "decimals": wstt_balance.decimals
-                    }
-                    logger.info(f"✅ WSTT Balance: {wstt_balance.balance} {wstt_balance.token_symbol}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to get WSTT balance: {e}")
-            
-            # Test SUSDT token balance
-            if settings.SUSDT:
-                try:
-                    susdt_balance = await service.get_token_balance(address, settings.SUSDT)
-                    token_balances['SUSDT'] = {
-                        "address": susdt_balance.token_address,
-                        "symbol": susdt_balance.token_symbol,
-                        "name": susdt_balance.token_name,
-                        "balance": str(susdt_balance.balance),
-                        "decimals": susdt_balance.decimals
-                    }
-                    logger.info(f"✅ SUSDT Balance: {susdt_balance.balance} {susdt_balance.token_symbol}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to get SUSDT balance: {e}")
-            
-            return token_balances
+            return await get_token_balances(service, address)
             
         except Exception as e:
-            logger.error(f"❌ Failed to get token balances: {e}")
+            logger.error("❌ Failed to get token balances: %s", e)
             raise
     
     async def run_complete_test(self):
@@ -474,15 +394,15 @@ class AccountBalanceTest:
             }
             
             logger.info("✅ Portfolio Summary:")
-            logger.info(f"  SOMI Balance: {balance_result['eth_balance']}")
-            logger.info(f"  Token Count: {len(token_balances)}")
-            logger.info(f"  Chain ID: {balance_result['chain_id']}")
+            logger.info("  SOMI Balance: %s", balance_result['eth_balance'])
+            logger.info("  Token Count: %s", len(token_balances))
+            logger.info("  Chain ID: %s", balance_result['chain_id'])
             
             logger.info("\n🎉 Integration test completed successfully!")
             return portfolio_summary
             
         except Exception as e:
-            logger.error(f"❌ Integration test failed: {e}")
+            logger.error("❌ Integration test failed: %s", e)
             raise
         finally:
             # Cleanup if needed
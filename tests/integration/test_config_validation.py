@@ -6,14 +6,14 @@ and can be run with pytest.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.core.backend_config import settings
+from tests.integration._helpers import is_hex
+
+
+def _is_addr(value) -> bool:
+    """Return True if value is a 0x-prefixed 20-byte hex address."""
+    return is_hex(value, 20)
 
 
 class TestConfigValidation:
@@ -34,36 +34,20 @@ class TestConfigValidation:
     
     def test_router_address_configured(self):
         """Test that Router address is configured."""
-        assert settings.ROUTER_ADDRESS is not None
-        assert isinstance(settings.ROUTER_ADDRESS, str)
-        assert settings.ROUTER_ADDRESS.startswith('0x')
-        assert len(settings.ROUTER_ADDRESS) == 42
+        assert _is_addr(settings.ROUTER_ADDRESS)
     
     def test_token_addresses_configured(self):
         """Test that token addresses are configured."""
-        assert settings.WSTT is not None
-        assert isinstance(settings.WSTT, str)
-        assert settings.WSTT.startswith('0x')
-        assert len(settings.WSTT) == 42
-        
-        assert settings.SUSDT is not None
-        assert isinstance(settings.SUSDT, str)
-        assert settings.SUSDT.startswith('0x')
-        assert len(settings.SUSDT) == 42
+        assert _is_addr(settings.WSTT)
+        assert _is_addr(settings.SUSDT)
     
     def test_private_key_configured(self):
         """Test that private key is configured."""
-        assert settings.PRIVATE_KEY is not None
-        assert isinstance(settings.PRIVATE_KEY, str)
-        assert settings.PRIVATE_KEY.startswith('0x')
-        assert len(settings.PRIVATE_KEY) == 66  # 0x + 64 hex chars
+        assert is_hex(settings.PRIVATE_KEY, 32)  # 0x + 64 hex chars
     
     def test_address_configured(self):
         """Test that address is configured."""
-        assert settings.ADDRESS is not None
-        assert isinstance(settings.ADDRESS, str)
-        assert settings.ADDRESS.startswith('0x')
-        assert len(settings.ADDRESS) == 42
+        assert _is_addr(settings.ADDRESS)
     
     def test_database_configured(self):
         """Test that database configuration is present."""
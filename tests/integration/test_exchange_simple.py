@@ -7,154 +7,152 @@ and can be run quickly to verify the exchange service works.
 
 import asyncio
 import logging
-import sys
-from pathlib import Path
-import httpx
 import pytest
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.core.backend_config import settings
-from app.services.somnia_exchange_service import SomniaExchangeService
-from web3 import AsyncWeb3
-from fastapi import FastAPI
-from app.api.routes.exchange import router
+
+# Skip the whole module at collection time when the blockchain stack is missing
+pytest.importorskip("web3")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# Upper bound for the whole parallel run, so a stalled RPC node cannot hang CI
+E2E_TIMEOUT = 20
+
+
+# Check coroutines shared by the individual tests and the parallel driver
+
+async def check_blockchain_connection(latest_block):
+    """Verify the RPC node is reachable and producing blocks."""
+    assert latest_block['number'] > 0, "Block number should be positive"
+    logger.info("✅ Connected to blockchain, latest block: %s", latest_block['number'])
+
+
+async def check_exchange_service(exchange_addresses):
+    """Verify the router exposes valid WETH and factory addresses."""
+    weth = exchange_addresses["weth"]
+    factory = exchange_addresses["factory"]
+    
+    assert weth is not None, "WETH address should not be None"
+    assert factory is not None, "Factory address should not be None"
+    assert weth.startswith('0x'), "WETH address should be valid hex"
+    assert factory.startswith('0x'), "Factory address should be valid hex"
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ Exchange service working:")
+        logger.info("  WETH: %s", weth)
+        logger.info("  Factory: %s", factory)
+
+
+async def check_quote_api(api_client):
+    """Verify the quote endpoint returns a positive amount_b."""
+    try:
+        test_request = {
+            "amount_a": 1000000000000000000,  # 1 token
+            "reserve_a": 10000000000000000000000,  # 10,000 tokens
+            "reserve_b": 5000000000000000000000   # 5,000 tokens
+        }
+        
+        response = await api_client.post("/exchange/quote", json=test_request)
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        
+        result = response.json()
+        assert "amount_b" in result, "Response should contain amount_b"
+        assert isinstance(result["amount_b"], int), "amount_b should be an integer"
+        assert result["amount_b"] > 0, "amount_b should be positive"
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Quote API working:")
+            logger.info("  Input amount: %s", test_request['amount_a'])
+            logger.info("  Output amount: %s", result['amount_b'])
+        
+    except Exception as e:
+        pytest.skip(f"❌ Quote API error: {e}")
+
+
+async def check_error_handling(api_client):
+    """Verify the quote endpoint rejects invalid input."""
+    try:
+        # Test with invalid data
+        invalid_request = {"amount_a": "invalid"}
+        
+        response = await api_client.post("/exchange/quote", json=invalid_request)
+        
+        assert response.status_code >= 400, f"Expected error status code, got {response.status_code}"
+        
+        # Verify error response structure
+        if response.headers.get("content-type", "").startswith("application/json"):
+            error_data = response.json()
+            assert "detail" in error_data or "message" in error_data, "Error response should contain details"
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Error handling working:")
+            logger.info("  Status code: %s", response.status_code)
+            logger.info("  Response: %s...", response.text[:100])
+        
+    except Exception as e:
+        pytest.skip(f"❌ Error handling test failed: {e}")
+
+
 # Pytest-compatible test functions
 
 
+async def test_chain_reads_parallel(w3, exchange_service):
+    """Fetch the latest block and router addresses concurrently, then run the chain checks."""
+    (latest_block, weth, factory) = await asyncio.wait_for(asyncio.gather(
+        w3.eth.get_block('latest'),
+        exchange_service.get_weth_address(),
+        exchange_service.get_factory_address(),
+        return_exceptions=True
+    ), timeout=E2E_TIMEOUT)
+    
+    for result in (latest_block, weth, factory):
+        if isinstance(result, BaseException):
+            pytest.skip(f"❌ Blockchain connection error: {result}")
+    
+    await check_blockchain_connection(latest_block)
+    await check_exchange_service({"weth": weth, "factory": factory})
+
+
+async def test_quote_api(api_client):
+    """Test the quote API endpoint; needs only the in-process app, not RPC."""
+    await check_quote_api(api_client)
+
+
+async def test_error_handling(api_client):
+    """Test the quote API's error handling on its own, so a quote skip cannot mask its result."""
+    await check_error_handling(api_client)
+
+
+@pytest.mark.serial
 class TestSimpleExchange:
-    """Pytest-compatible test class for exchange integration."""
+    """Pytest-compatible test class for exchange integration (run with --serial)."""
     
     def setup_class(cls):
         """Setup class-level configuration logging."""
-        logger.info("🔧 Exchange Test Configuration:")
-        logger.info(f"  RPC URL: {settings.RPC_URL}")
-        logger.info(f"  Chain ID: {settings.CHAIN_ID}")
-        logger.info(f"  Router: {settings.ROUTER_ADDRESS}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔧 Exchange Test Configuration:")
+            logger.info("  RPC URL: %s", settings.RPC_URL)
+            logger.info("  Chain ID: %s", settings.CHAIN_ID)
+            logger.info("  Router: %s", settings.ROUTER_ADDRESS)
     
-    @pytest.mark.asyncio
-    async def test_blockchain_connection(self):
+    async def test_blockchain_connection(self, latest_block):
         """Test basic blockchain connection."""
-        print("\n🔗 Blockchain Connection Test")
-        print("=" * 50)
-        
-        try:
-            w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(settings.RPC_URL))
-            is_connected = await w3.is_connected()
-            
-            if is_connected:
-                latest_block = await w3.eth.get_block('latest')
-                assert latest_block['number'] > 0, "Block number should be positive"
-                logger.info(f"✅ Connected to blockchain, latest block: {latest_block['number']}")
-            else:
-                pytest.skip("❌ Failed to connect to blockchain")
-                
-        except Exception as e:
-            pytest.skip(f"❌ Blockchain connection error: {e}")
+        await check_blockchain_connection(latest_block)
     
-    @pytest.mark.asyncio
-    async def test_exchange_service(self):
+    async def test_exchange_service(self, exchange_addresses):
         """Test exchange service initialization."""
-        print("\n🔄 Exchange Service Test")
-        print("=" * 50)
-        
-        try:
-            w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(settings.RPC_URL))
-            service = SomniaExchangeService(w3, settings.ROUTER_ADDRESS)
-            
-            # Test basic service calls
-            weth = await service.get_weth_address()
-            factory = await service.get_factory_address()
-            
-            assert weth is not None, "WETH address should not be None"
-            assert factory is not None, "Factory address should not be None"
-            assert weth.startswith('0x'), "WETH address should be valid hex"
-            assert factory.startswith('0x'), "Factory address should be valid hex"
-            
-            logger.info(f"✅ Exchange service working:")
-            logger.info(f"  WETH: {weth}")
-            logger.info(f"  Factory: {factory}")
-            
-        except Exception as e:
-            pytest.skip(f"❌ Exchange service error: {e}")
-    
-    @pytest.mark.asyncio
-    async def test_quote_api(self):
-        """Test the quote API endpoint."""
-        print("\n💱 Quote API Test")
-        print("=" * 50)
-        
-        try:
-            app = FastAPI()
-            app.include_router(router)
-            
-            test_request = {
-                "amount_a": 1000000000000000000,  # 1 token
-                "reserve_a": 10000000000000000000000,  # 10,000 tokens
-                "reserve_b": 5000000000000000000000   # 5,000 tokens
-            }
-            
-            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post("/exchange/quote", json=test_request)
-                
-                assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-                
-                result = response.json()
-                assert "amount_b" in result, "Response should contain amount_b"
-                assert isinstance(result["amount_b"], int), "amount_b should be an integer"
-                assert result["amount_b"] > 0, "amount_b should be positive"
-                
-                logger.info(f"✅ Quote API working:")
-                logger.info(f"  Input amount: {test_request['amount_a']}")
-                logger.info(f"  Output amount: {result['amount_b']}")
-                    
-        except Exception as e:
-            pytest.skip(f"❌ Quote API error: {e}")
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self):
-        """Test error handling."""
-        print("\n⚠️ Error Handling Test")
-        print("=" * 50)
-        
-        try:
-            app = FastAPI()
-            app.include_router(router)
-            
-            # Test with invalid data
-            invalid_request = {"amount_a": "invalid"}
-            
-            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post("/exchange/quote", json=invalid_request)
-                
-                assert response.status_code >= 400, f"Expected error status code, got {response.status_code}"
-                
-                # Verify error response structure
-                if response.headers.get("content-type", "").startswith("application/json"):
-                    error_data = response.json()
-                    assert "detail" in error_data or "message" in error_data, "Error response should contain details"
-                
-                logger.info(f"✅ Error handling working:")
-                logger.info(f"  Status code: {response.status_code}")
-                logger.info(f"  Response: {response.text[:100]}...")
-                    
-        except Exception as e:
-            pytest.skip(f"❌ Error handling test failed: {e}")
+        await check_exchange_service(exchange_addresses)
 
 
 # Pytest markers for test categorization
 pytestmark = [
     pytest.mark.integration,
-    pytest.mark.blockchain,
-    pytest.mark.asyncio
+    pytest.mark.blockchain
 ]
 
 
@@ -4,125 +4,84 @@ Test to verify that pytest can discover all integration tests.
 This test validates that the pytest conversion was successful.
 """
 
+import importlib
+import os
 import pytest
-import sys
 from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+
+# (module path, test class, minimum number of test methods it must define)
+DISCOVERY_TABLE = [
+    ("tests.integration.test_config_validation", "TestConfigValidation", 5),
+    ("tests.integration.test_simple_balance", "TestSimpleBalance", 5),
+    ("tests.integration.test_user_deletion", "TestUserDeletionIntegration", 5),
+    ("tests.integration.test_exchange_integration", "TestExchangeIntegration", 5),
+    ("tests.integration.test_simple_api", "TestSimpleAPI", 3),
+    ("tests.integration.test_account_balance", "TestAccountBalance", 5),
+]
+TEST_MODULES = [module_path for module_path, _, _ in DISCOVERY_TABLE]
+
+
+@pytest.fixture(scope="module")
+def imported_test_modules():
+    """Import each integration test module once; modules that fail to import are left out.
+    
+    A module that skips itself at import (e.g. missing blockchain config) maps to its
+    skip exception, so only the tests for that module skip.
+    """
+    modules = {}
+    for name in TEST_MODULES:
+        try:
+            modules[name] = importlib.import_module(name)
+        except ImportError:
+            pass  # Skip if module can't be imported
+        except pytest.skip.Exception as e:
+            modules[name] = e
+    return modules
 
 
 class TestPytestDiscovery:
     """Test that pytest can discover all integration tests."""
     
-    def test_config_validation_discoverable(self):
-        """Test that config validation tests are discoverable."""
-        # This test just verifies the structure exists
-        from tests.integration.test_config_validation import TestConfigValidation
+    @pytest.mark.parametrize("module_path,class_name,min_methods", DISCOVERY_TABLE,
+                             ids=[class_name for _, class_name, _ in DISCOVERY_TABLE])
+    def test_discoverable(self, imported_test_modules, module_path, class_name, min_methods):
+        """Test that each integration test class exposes its test methods."""
+        # Re-importing a module that failed surfaces its real ImportError
+        module = imported_test_modules.get(module_path) or importlib.import_module(module_path)
+        if isinstance(module, pytest.skip.Exception):
+            pytest.skip(f"{module_path} skipped at import: {module.msg}")
+        test_class = getattr(module, class_name)
         
         # Check that the class has test methods
-        test_methods = [method for method in dir(TestConfigValidation) if method.startswith('test_')]
+        method_count = sum(1 for name in vars(test_class) if name.startswith('test_'))
         
-        assert len(test_methods) >= 5, f"Expected at least 5 test methods, found {len(test_methods)}"
+        assert method_count >= min_methods, f"Expected at least {min_methods} test methods, found {method_count}"
         
-        print(f"✅ Config validation has {len(test_methods)} discoverable test methods")
-    
-    def test_simple_balance_discoverable(self):
-        """Test that simple balance tests are discoverable."""
-        from tests.integration.test_simple_balance import TestSimpleBalance
-        
-        # Check that the class has test methods
-        test_methods = [method for method in dir(TestSimpleBalance) if method.startswith('test_')]
-        
-        assert len(test_methods) >= 5, f"Expected at least 5 test methods, found {len(test_methods)}"
-        
-        print(f"✅ Simple balance has {len(test_methods)} discoverable test methods")
-    
-    def test_user_deletion_discoverable(self):
-        """Test that user deletion tests are discoverable."""
-        from tests.integration.test_user_deletion import TestUserDeletionIntegration
-        
-        # Check that the class has test methods
-        test_methods = [method for method in dir(TestUserDeletionIntegration) if method.startswith('test_')]
-        
-        assert len(test_methods) >= 5, f"Expected at least 5 test methods, found {len(test_methods)}"
-        
-        print(f"✅ User deletion has {len(test_methods)} discoverable test methods")
-    
-    def test_exchange_pytest_discoverable(self):
-        """Test that exchange pytest tests are discoverable."""
-        from tests.integration.test_exchange_pytest import TestExchangeIntegration
-        
-        # Check that the class has test methods
-        test_methods = [method for method in dir(TestExchangeIntegration) if method.startswith('test_')]
-        
-        assert len(test_methods) >= 5, f"Expected at least 5 test methods, found {len(test_methods)}"
-        
-        print(f"✅ Exchange integration has {len(test_methods)} discoverable test methods")
-    
-    def test_simple_api_discoverable(self):
-        """Test that simple API tests are discoverable."""
-        from tests.integration.test_simple_api import TestSimpleAPI
-        
-        # Check that the class has test methods
-        test_methods = [method for method in dir(TestSimpleAPI) if method.startswith('test_')]
-        
-        assert len(test_methods) >= 3, f"Expected at least 3 test methods, found {len(test_methods)}"
-        
-        print(f"✅ Simple API has {len(test_methods)} discoverable test methods")
-    
-    def test_account_balance_discoverable(self):
-        """Test that account balance tests are discoverable."""
-        from tests.integration.test_account_balance import TestAccountBalance
-        
-        # Check that the class has test methods
-        test_methods = [method for method in dir(TestAccountBalance) if method.startswith('test_')]
-        
-        assert len(test_methods) >= 5, f"Expected at least 5 test methods, found {len(test_methods)}"
-        
-        print(f"✅ Account balance has {len(test_methods)} discoverable test methods")
+        print(f"✅ {class_name} has {method_count} discoverable test methods")
     
     def test_all_integration_files_exist(self):
         """Test that all expected integration test files exist."""
-        integration_dir = Path(__file__).parent
+        # One directory scan instead of a stat() per expected file
+        present = {entry.name for entry in os.scandir(Path(__file__).parent) if entry.is_file()}
         
-        expected_files = [
+        expected_files = frozenset([
             "test_config_validation.py",
             "test_simple_balance.py", 
             "test_account_balance.py",
             "test_user_deletion.py",
-            "test_exchange_pytest.py",
+            "test_exchange_integration.py",
             "test_simple_api.py"
-        ]
+        ])
         
-        for filename in expected_files:
-            file_path = integration_dir / filename
-            assert file_path.exists(), f"Expected test file not found: {filename}"
+        missing = expected_files - present
+        assert not missing, f"Expected test files not found: {sorted(missing)}"
         
         print(f"✅ All {len(expected_files)} expected test files exist")
     
-    def test_pytest_markers_configured(self):
+    def test_pytest_markers_configured(self, imported_test_modules):
         """Test that pytest markers are properly configured."""
-        # Import test modules to check for markers
-        test_modules = [
-            "tests.integration.test_config_validation",
-            "tests.integration.test_simple_balance",
-            "tests.integration.test_account_balance",
-            "tests.integration.test_user_deletion",
-            "tests.integration.test_exchange_pytest",
-            "tests.integration.test_simple_api"
-        ]
-        
-        markers_found = 0
-        
-        for module_name in test_modules:
-            try:
-                module = __import__(module_name, fromlist=[''])
-                if hasattr(module, 'pytestmark'):
-                    markers_found += 1
-            except ImportError:
-                pass  # Skip if module can't be imported
+        markers_found = sum(1 for module in imported_test_modules.values() if hasattr(module, 'pytestmark'))
         
         assert markers_found >= 3, f"Expected at least 3 modules with pytest markers, found {markers_found}"
         
@@ -0,0 +1,80 @@
+"""
+Shared fixtures for the unit test suite.
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.exchange import router, get_exchange_service
+
+# One test app for the whole unit suite, so the exchange router is mounted once
+_app = FastAPI()
+_app.include_router(router)
+
+# ASGITransport holds no connection state, so every async client can wrap this one instance
+_transport = httpx.ASGITransport(app=_app)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI app with the exchange router mounted, shared by every unit test."""
+    return _app
+
+
+class StubExchangeService:
+    """Stand-in for SomniaExchangeService with just the awaitable quote() the quote route calls.
+    
+    Tests set ``quote_result`` or ``quote_error`` and read the recorded ``quote_calls``.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.quote_result = None
+        self.quote_error = None
+        self.quote_calls = []
+    
+    async def quote(self, amount_a, reserve_a, reserve_b):
+        self.quote_calls.append((amount_a, reserve_a, reserve_b))
+        if self.quote_error is not None:
+            raise self.quote_error
+        return self.quote_result
+
+
+@pytest.fixture(scope="session")
+def stub_exchange_service():
+    """Stub exchange service, built once per session and reset after every test."""
+    return StubExchangeService()
+
+
+@pytest.fixture(autouse=True)
+def _reset_stub_exchange_service(stub_exchange_service):
+    """Clear the configured result, error and recorded calls so no test sees another's setup."""
+    yield
+    stub_exchange_service.reset()
+
+
+@pytest.fixture(autouse=True)
+def override_exchange_service(app, stub_exchange_service):
+    """Route every request's exchange service dependency to the shared stub for the test's duration."""
+    app.dependency_overrides[get_exchange_service] = lambda: stub_exchange_service
+    yield stub_exchange_service
+    app.dependency_overrides.pop(get_exchange_service, None)
+
+
+@pytest.fixture(scope="session")
+def test_client(app):
+    """Synchronous client for one-shot requests; one portal thread serves the whole session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """Async ASGI client for tests that issue concurrent requests, shared within a module."""
+    async with httpx.AsyncClient(transport=_transport, base_url="http://test") as c:
+        yield c
@@ -0,0 +1,102 @@
+"""
+Unit tests for SomniaExchangeService.quote_batch against a stubbed AsyncWeb3.
+
+This test suite covers:
+1. Every quote is queued on one batch and the results come back in order
+2. A failed call in the batch is re-raised instead of yielding partial results
+"""
+
+import pytest
+
+from app.services.somnia_exchange_service import SomniaExchangeService
+
+ROUTER_ADDRESS = "0x" + "11" * 20
+
+QUOTES = [
+    # (amount_a, reserve_a, reserve_b)
+    (1000000000000000000, 10000000000000000000000, 5000000000000000000000),
+    (5000000000000000000, 20000000000000000000000, 10000000000000000000000),
+]
+
+
+class StubBatch:
+    """Stand-in for web3's async batch: records added calls and answers them with ``results``."""
+
+    def __init__(self, results=None, error=None):
+        self.results = results
+        self.error = error
+        self.calls = []
+        self.executed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, call):
+        self.calls.append(call)
+
+    async def async_execute(self):
+        self.executed += 1
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+
+class StubQuoteFunctions:
+    """Contract ``functions`` namespace whose quote() returns its arguments as the call marker."""
+
+    def quote(self, amount_a, reserve_a, reserve_b):
+        return ("quote", amount_a, reserve_a, reserve_b)
+
+
+class StubContract:
+    functions = StubQuoteFunctions()
+
+
+class StubEth:
+    def contract(self, address, abi):
+        return StubContract()
+
+
+class StubWeb3:
+    """AsyncWeb3 stand-in exposing just eth.contract() and batch_requests()."""
+
+    def __init__(self, batch):
+        self.eth = StubEth()
+        self.batch = batch
+
+    def batch_requests(self):
+        return self.batch
+
+
+def make_service(batch):
+    """Exchange service bound to a stub web3 that hands out ``batch``."""
+    return SomniaExchangeService(StubWeb3(batch), ROUTER_ADDRESS)
+
+
+class TestQuoteBatch:
+    """Test SomniaExchangeService.quote_batch."""
+
+    @pytest.mark.asyncio
+    async def test_quote_batch_success(self):
+        """Test that all quotes go out in one batch and the results keep their order."""
+        batch = StubBatch(results=(500000000000000000, 2500000000000000000))
+
+        results = await make_service(batch).quote_batch(QUOTES)
+
+        assert results == [500000000000000000, 2500000000000000000]
+        assert batch.calls == [("quote", *quote) for quote in QUOTES]
+        assert batch.executed == 1
+
+    @pytest.mark.asyncio
+    async def test_quote_batch_partial_failure(self):
+        """Test that one failed call in the batch fails the whole batch with its error."""
+        batch = StubBatch(error=ValueError("execution reverted: INSUFFICIENT_LIQUIDITY"))
+
+        with pytest.raises(ValueError, match="INSUFFICIENT_LIQUIDITY"):
+            await make_service(batch).quote_batch(QUOTES)
+
+        assert batch.calls == [("quote", *quote) for quote in QUOTES]
+        assert batch.executed == 1
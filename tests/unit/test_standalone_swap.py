@@ -0,0 +1,66 @@
+"""
+Unit tests for the retry helper of the standalone swap script.
+
+This test suite covers:
+1. A 500 whose JSON detail reports a nonce conflict is retried
+2. Any other 500 is returned without a retry
+"""
+
+import httpx
+import pytest
+
+from tests.standalone.standalone_swap import SwapIntegrationTest, error_detail_of
+
+NONCE_DETAIL = {"detail": "Error swapping tokens: nonce too low"}
+
+
+def make_swap_test(responses):
+    """SwapIntegrationTest whose client answers each POST with the next of ``responses``.
+
+    __init__ is bypassed because it derives the test account from settings; post_with_retry only needs the client.
+    """
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    swap_test = SwapIntegrationTest.__new__(SwapIntegrationTest)
+    swap_test.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://test")
+    return swap_test, requests
+
+
+def test_error_detail_of_reads_500_json_detail():
+    """Test that the detail of a JSON 500 is returned instead of a generic message."""
+    response = httpx.Response(500, json=NONCE_DETAIL)
+
+    assert error_detail_of(response) == NONCE_DETAIL["detail"]
+
+
+@pytest.mark.asyncio
+async def test_post_with_retry_retries_nonce_500():
+    """Test that a 500 reporting a nonce conflict is retried until the swap succeeds."""
+    swap_test, requests = make_swap_test([
+        httpx.Response(500, json=NONCE_DETAIL),
+        httpx.Response(200, json={"transaction_hash": "0x" + "ab" * 32}),
+    ])
+
+    async with swap_test.client:
+        response = await swap_test.post_with_retry("/exchange/swap", base_delay=0)
+
+    assert response.status_code == 200
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_post_with_retry_returns_other_500():
+    """Test that a 500 without a nonce conflict is returned after a single attempt."""
+    swap_test, requests = make_swap_test([
+        httpx.Response(500, json={"detail": "Error swapping tokens: execution reverted"}),
+    ])
+
+    async with swap_test.client:
+        response = await swap_test.post_with_retry("/exchange/swap", base_delay=0)
+
+    assert response.status_code == 500
+    assert len(requests) == 1